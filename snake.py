@@ -1,10 +1,13 @@
-from copy import copy
+from array import array
+from collections import deque
 from enum import Enum
+from functools import lru_cache
 from pynput import keyboard
-from time import sleep
+from time import monotonic, sleep
 from typing import Final
 
 import random
+import sys
 
 class Direction(Enum):
     Up    = 0
@@ -12,7 +15,28 @@ class Direction(Enum):
     Left  = 2
     Right = 3
 
+    def Opposite(self) -> "Direction":
+        # Note: opposite directions are paired up as (Up, Down) and (Left, Right)
+        return Direction(self.value ^ 1)
+
+# (dx, dy) for each direction, indexed by Direction.value
+kDirectionDeltas:Final = (
+    ( 0, -1), # Up
+    ( 0,  1), # Down
+    (-1,  0), # Left
+    ( 1,  0), # Right
+)
+
+kKeyDirections:Final = {
+    keyboard.Key.up:    Direction.Up,
+    keyboard.Key.down:  Direction.Down,
+    keyboard.Key.left:  Direction.Left,
+    keyboard.Key.right: Direction.Right,
+}
+
 class Position:
+    __slots__ = ("x", "y")
+
     x:int
     y:int
 
@@ -21,7 +45,7 @@ class Position:
         self.y = y
 
     def __hash__(self):
-        return hash(self.x) + hash(self.y)
+        return hash((self.x, self.y))
 
     def __eq__(self, position:"Position"):
         return self.x == position.x and self.y == position.y
@@ -36,18 +60,84 @@ class ControlCodes:
     BlueFG      = "\x1b[94m"
     MagentaFG   = "\x1b[95m"
     CyanFG      = "\x1b[96m"
+    EraseLine   = "\x1b[K"
+
+    @staticmethod
+    def MoveCursor(row:int, column:int) -> str:
+        """Returns the control code to move the cursor to the 1-based `row` and `column`"""
+        return f"\x1b[{row};{column}H"
+
+# Palette index of an empty cell
+kEmptySymbol:Final = 0
 
 class Board:
-    kEmptySymbol:Final = " "
+    # Palette of every symbol that can be drawn on the board. Cells in `grid` store indices into this list
+    symbols:list[str] = [" ", "╔", "╗", "╚", "╝", "║", "═"]
+
+    kUpperLeftBoarderSymbol:Final  = 1
+    kUpperRightBoarderSymbol:Final = 2
+    kLowerLeftBoarderSymbol:Final  = 3
+    kLowerRightBoarderSymbol:Final = 4
+    kVerticalBoarderSymbol:Final   = 5
+    kHorizontalBoarderSymbol:Final = 6
+
     kBoarderSize:Final = 1
 
+    __slots__ = (
+        "width", "height", "paddedWidth", "paddedHeight",
+        "grid", "dirtyIndices", "emptyIndices", "emptyIndexSlots",
+    )
+
     width:int
     height:int
     paddedWidth:int
     paddedHeight:int
 
-    grid:list[str]
-    emptyIndices:set[int]
+    grid:bytearray
+
+    # grid indices that have changed since they were last drawn
+    dirtyIndices:list[int]
+
+    # Empty cells are kept in a list for O(1) random sampling, with each index's slot
+    # in that list tracked so it can be removed in O(1) by swapping with the last element
+    emptyIndices:list[int]
+    emptyIndexSlots:dict[int, int]
+
+    @staticmethod
+    def AddSymbol(symbol:str) -> int:
+        """Adds a symbol to the palette and returns the index used to store it in the grid"""
+        Board.symbols.append(symbol)
+        return len(Board.symbols) - 1
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def MakeDefaultGrid(width:int, height:int) -> bytes:
+        """Returns the symbols of an empty board surrounded by its boarder. Cached so boards of the same size share the work"""
+
+        paddedWidth  = width  + 2*Board.kBoarderSize
+        paddedHeight = height + 2*Board.kBoarderSize
+
+        # Initialize grid with slice fills instead of visiting each cell
+        grid = bytearray([kEmptySymbol]) * (paddedWidth * paddedHeight)
+        for y in [*range(Board.kBoarderSize), *range(paddedHeight - Board.kBoarderSize, paddedHeight)]:
+            rowStart = y * paddedWidth
+            rowEnd   = rowStart + paddedWidth
+            isTop    = y < Board.kBoarderSize
+
+            # top/bottom boarder
+            grid[rowStart + Board.kBoarderSize : rowEnd - Board.kBoarderSize] = bytes([Board.kHorizontalBoarderSymbol]) * width
+
+            # corners
+            grid[rowStart : rowStart + Board.kBoarderSize] = bytes([Board.kUpperLeftBoarderSymbol if isTop else Board.kLowerLeftBoarderSymbol]) * Board.kBoarderSize
+            grid[rowEnd - Board.kBoarderSize : rowEnd]     = bytes([Board.kUpperRightBoarderSymbol if isTop else Board.kLowerRightBoarderSymbol]) * Board.kBoarderSize
+
+        # left/right boarder
+        firstRow = Board.kBoarderSize * paddedWidth
+        lastRow  = (paddedHeight - Board.kBoarderSize) * paddedWidth
+        for x in [*range(Board.kBoarderSize), *range(paddedWidth - Board.kBoarderSize, paddedWidth)]:
+            grid[firstRow + x : lastRow : paddedWidth] = bytes([Board.kVerticalBoarderSymbol]) * height
+
+        return bytes(grid)
 
     def __init__(self, width, height):
         
@@ -58,81 +148,82 @@ class Board:
         self.paddedWidth  = width  + 2*Board.kBoarderSize
         self.paddedHeight = height + 2*Board.kBoarderSize
 
-        # Initialize grid
-        self.grid = []
-        self.emptyIndices = set()
-        for y in range(self.paddedHeight):
-            for x in range(self.paddedWidth):
+        self.dirtyIndices = []
 
-                symbol = self.GetDefaultSymbol(x, y)
-                self.grid.append(symbol)
+        # Initialize grid with a mutable copy of the cached default layout
+        self.grid = bytearray(Board.MakeDefaultGrid(width, height))
 
-                if symbol == Board.kEmptySymbol:
-                    self.emptyIndices.add(y * self.paddedWidth + x)
+        # everything inside the boarder starts empty
+        firstRow = Board.kBoarderSize * self.paddedWidth
+        lastRow  = (self.paddedHeight - Board.kBoarderSize) * self.paddedWidth
+        self.emptyIndices = []
+        for rowStart in range(firstRow, lastRow, self.paddedWidth):
+            self.emptyIndices.extend(range(rowStart + Board.kBoarderSize, rowStart + Board.kBoarderSize + self.width))
 
+        self.emptyIndexSlots = dict(zip(self.emptyIndices, range(len(self.emptyIndices))))
 
-    def __str__(self):
-        result = ""
-        for y in range(self.paddedHeight):
-            for x in range(self.paddedWidth):
-                result+= self.grid[y * self.paddedWidth + x] 
-            
-            result+= "\n"
 
-        return result
+    def __str__(self):
+        getSymbol = Board.symbols.__getitem__
+        rows = [
+            "".join(map(getSymbol, self.grid[rowStart : rowStart + self.paddedWidth]))
+            for rowStart in range(0, len(self.grid), self.paddedWidth)
+        ]
 
-    def GetDefaultSymbol(self, x:int, y:int) -> str:
-        if x < Board.kBoarderSize:
-            if y < Board.kBoarderSize:
-                # upper left boarder
-                return "╔"
-        
-            if y >= self.height + self.kBoarderSize:
-                # lower left boarder
-                return "╚"
+        # trailing newline after the last row
+        rows.append("")
+        return "\n".join(rows)
 
-            # left boarder
-            return "║"
+    def GetSymbol(self, position:Position) -> int:
+        return self.grid[self.PositionToIndex(position)]
 
-        if x >= self.width + self.kBoarderSize:
-            if y < Board.kBoarderSize:
-                # upper right boarder
-                return "╗"
+    def GetSymbolAtIndex(self, index:int) -> int:
+        return self.grid[index]
 
-            if y >= self.height + self.kBoarderSize:
-                # lower right boarder
-                return "╝"
+    def SetSymbol(self, position:Position, symbol:int) -> None:
+        self.SetSymbolAtIndex(self.PositionToIndex(position), symbol)
 
-            # right boarder
-            return "║"
+    def SetSymbolAtIndex(self, index:int, symbol:int) -> None:
+        self.grid[index] = symbol
+        self.dirtyIndices.append(index)
         
-        if y < Board.kBoarderSize or y >= self.height + self.kBoarderSize:
-            # top/bottom boarder
-            return "═"
+        if symbol == kEmptySymbol:
+            self.AddEmptyIndex(index)
+        else:
+            self.RemoveEmptyIndex(index)
 
-        # generic space
-        return Board.kEmptySymbol
+    def SetSymbolAtIndices(self, indices:list[int], symbol:int) -> None:
+        """Sets every grid index in `indices` to `symbol`"""
+        for index in indices:
+            self.SetSymbolAtIndex(index, symbol)
 
-    def GetSymbol(self, position:Position) -> str:
-        return self.grid[self.PositionToIndex(position)]
+    def AddEmptyIndex(self, index:int) -> None:
+        if index in self.emptyIndexSlots:
+            return
 
-    def SetSymbol(self, position:Position, symbol:str) -> None:
-        index = self.PositionToIndex(position)
-        self.grid[index] = symbol
-        
-        if symbol == Board.kEmptySymbol:
-            self.emptyIndices.add(index)
-        else:
-            self.emptyIndices.discard(index)
+        self.emptyIndexSlots[index] = len(self.emptyIndices)
+        self.emptyIndices.append(index)
+
+    def RemoveEmptyIndex(self, index:int) -> None:
+        slot = self.emptyIndexSlots.pop(index, None)
+        if slot is None:
+            return
 
-    def InBounds(self, position:Position) -> bool:
-        return (0 <= position.x < self.width) and (0 <= position.y < self.height)
+        # move the last empty index into the freed slot
+        lastIndex = self.emptyIndices.pop()
+        if lastIndex != index:
+            self.emptyIndices[slot] = lastIndex
+            self.emptyIndexSlots[lastIndex] = slot
+
+    @staticmethod
+    def IsBoarderSymbol(symbol:int) -> bool:
+        return Board.kUpperLeftBoarderSymbol <= symbol <= Board.kHorizontalBoarderSymbol
 
     def GetEmptyPosition(self) -> Position | None:
         if len(self.emptyIndices) == 0:
             return None
 
-        index = random.choice(list(self.emptyIndices))
+        index = self.emptyIndices[random.randrange(len(self.emptyIndices))]
         return self.IndexToPosition(index)
 
     def IndexToPosition(self, index:int) -> Position:
@@ -141,141 +232,171 @@ class Board:
         return Position(x - Board.kBoarderSize, y - Board.kBoarderSize)
 
     def PositionToIndex(self, position:Position) -> int:
-        return (position.y + Board.kBoarderSize) * self.paddedWidth + (position.x + Board.kBoarderSize)
+        return self.CoordinateToIndex(position.x, position.y)
+
+    def CoordinateToIndex(self, x:int, y:int) -> int:
+        return (y + Board.kBoarderSize) * self.paddedWidth + (x + Board.kBoarderSize)
 
 
 
+# Frequently used symbols hoisted to module scope so hot paths load them as plain globals
+kSnakeBodySymbol:Final  = Board.AddSymbol(f"{ControlCodes.GreenFG}∗{ControlCodes.Reset}")
+kSnakeDeathSymbol:Final = Board.AddSymbol(f"{ControlCodes.RedFG}∗{ControlCodes.Reset}")
+kAppleSymbol:Final      = Board.AddSymbol(f"{ControlCodes.RedFG}O{ControlCodes.Reset}")
+kSuperAppleSymbol:Final = Board.AddSymbol(f"{ControlCodes.CyanFG}S{ControlCodes.Reset}")
+
+
 class Snake:
-    kBodySymbol:Final = f"{ControlCodes.GreenFG}∗{ControlCodes.Reset}"
-    kDeathSymbol:Final = f"{ControlCodes.RedFG}∗{ControlCodes.Reset}"
+    __slots__ = (
+        "board", "direction", "xs", "ys", "headIndex", "tailIndex", "size",
+        "numSegmentsToGrow", "isDead",
+    )
 
     board:Board
     direction:Direction
+
+    # ring buffer of segment coordinates stored as parallel x/y arrays. Live segments run from
+    # tailIndex up to headIndex (wrapping around), any remaining slots are spare capacity reserved for growth
+    xs:array
+    ys:array
     headIndex:int
-    segments:list[Position]
+    tailIndex:int
+    size:int
 
-    numSegmentsToGrow:int = 0
-    isDead = False
+    numSegmentsToGrow:int
+    isDead:bool
 
 
     def __init__(self, board:Board, direction:Direction, position:Position):
         self.board = board
         self.direction = direction
+        self.numSegmentsToGrow = 0
+        self.isDead = False
         self.headIndex = 0
-        self.segments = [position]
+        self.tailIndex = 0
+        self.size = 1
+        self.xs = array("i", [position.x])
+        self.ys = array("i", [position.y])
 
     def Kill(self) -> None:
         self.isDead = True
-        headPosition = self.segments[self.headIndex]
-        self.board.SetSymbol(headPosition, Snake.kDeathSymbol)
+        headBoardIndex = self.board.CoordinateToIndex(self.xs[self.headIndex], self.ys[self.headIndex])
+        self.board.SetSymbolAtIndex(headBoardIndex, kSnakeDeathSymbol)
 
     def GetPosition(self, index:int) -> Position:
-        return self.segments[index]
+        return Position(self.xs[index], self.ys[index])
 
     def Size(self) -> int:
-        return len(self.segments)
+        return self.size + self.numSegmentsToGrow
+
+    def Reserve(self, capacity:int) -> None:
+        """Makes sure the ring buffer has room for at least `capacity` segments"""
+
+        numNewSlots = capacity - len(self.xs)
+        if numNewSlots <= 0:
+            return
+
+        # open up spare slots directly in front of the head so the live segments stay contiguous
+        insertIndex = self.headIndex + 1
+        self.xs[insertIndex:insertIndex] = array("i", [0]) * numNewSlots
+        self.ys[insertIndex:insertIndex] = array("i", [0]) * numNewSlots
+        if self.tailIndex >= insertIndex:
+            self.tailIndex+= numNewSlots
 
     def SetSize(self, size) -> None:
-        numSegments = len(self.segments)
+        currentSize = self.Size()
 
-        if size > numSegments:
+        if size > currentSize:
             
-            # add growth
-            self.numSegmentsToGrow = size - numSegments
-
-            # Add segments to head
-            headPosition = self.segments[self.headIndex]
-            for _ in range(self.numSegmentsToGrow):
-                self.segments.insert(self.headIndex, copy(headPosition))
+            # add growth. Note: segments are added to the head as the snake moves
+            self.numSegmentsToGrow+= size - currentSize
+            self.Reserve(size)
 
         else:
-            numSegmentsToDelete = numSegments - size
+            numSegmentsToDelete = currentSize - size
 
             # remove growth
-            self.numSegmentsToGrow-= numSegmentsToDelete
-            if self.numSegmentsToGrow < 0:
-                self.numSegmentsToGrow = 0
-
-            # remove segments from tail
-            for _ in range(numSegmentsToDelete):
-
-                # make sure the snake is always at least 1 unit long
-                if len(self.segments) == 1:
-                    break
-                
-                tailIndex = self.GetTailIndex()
-                tailPosition = self.segments.pop(tailIndex)
-                self.board.SetSymbol(tailPosition, Board.kEmptySymbol)
-    
-                # Note: no need to change head index if we're popping segments off in front of it
-                if tailIndex < self.headIndex:
-                    self.headIndex-= 1
-
-
-    def GetTailIndex(self) -> int:
-        tailIndex = self.headIndex + 1
-        if tailIndex >= len(self.segments):
-            return 0
-        return tailIndex
-
-    def Move(self) -> tuple[Position, str]:
-        """Moves the snake in the direction it was going and returns the new position of its head and the symbol it consumed"""
+            numGrowthToDelete = min(numSegmentsToDelete, self.numSegmentsToGrow)
+            self.numSegmentsToGrow-= numGrowthToDelete
+            numSegmentsToDelete-= numGrowthToDelete
+
+            # remove segments from tail. Note: the snake is always at least 1 unit long
+            numSegmentsToDelete = min(numSegmentsToDelete, self.size - 1)
+            if numSegmentsToDelete <= 0:
+                return
+
+            capacity = len(self.xs)
+            tailIndices = [(self.tailIndex + i) % capacity for i in range(numSegmentsToDelete)]
+            self.board.SetSymbolAtIndices(
+                [self.board.CoordinateToIndex(self.xs[tailIndex], self.ys[tailIndex]) for tailIndex in tailIndices],
+                kEmptySymbol
+            )
+
+            self.tailIndex = (self.tailIndex + numSegmentsToDelete) % capacity
+            self.size-= numSegmentsToDelete
+
+    def Move(self) -> tuple[int, int]:
+        """Moves the snake in the direction it was going and returns the new grid index of its head and the symbol it consumed"""
         
         if self.isDead:
             # Don't do anything.
-            return self.segments[self.headIndex], ""
-
-        # get new snake head position
-        newHeadPosition = copy(self.segments[self.headIndex])
-        match self.direction:
-            case Direction.Up:
-                newHeadPosition.y-= 1
-
-            case Direction.Down:
-                newHeadPosition.y+= 1
+            return self.board.CoordinateToIndex(self.xs[self.headIndex], self.ys[self.headIndex]), kEmptySymbol
 
-            case Direction.Left:
-                newHeadPosition.x-= 1
+        xs = self.xs
+        ys = self.ys
+        board = self.board
+        capacity = len(xs)
+        headIndex = self.headIndex
 
-            case Direction.Right:
-                newHeadPosition.x+= 1
+        # get new snake head position
+        dx, dy = kDirectionDeltas[self.direction.value]
+        x = xs[headIndex] + dx
+        y = ys[headIndex] + dy
 
         # erase snake's tail segment
-        tailIndex = self.GetTailIndex()
         if self.numSegmentsToGrow > 0:
             self.numSegmentsToGrow-= 1
+            self.size+= 1
 
         else:        
-            tailPosition = self.segments[tailIndex]
-            self.board.SetSymbol(tailPosition, Board.kEmptySymbol)
+            tailIndex = self.tailIndex
+            board.SetSymbolAtIndex(board.CoordinateToIndex(xs[tailIndex], ys[tailIndex]), kEmptySymbol)
+            self.tailIndex = (tailIndex + 1) % capacity
+
+        # write new head segment into the next slot of the ring
+        headIndex = (headIndex + 1) % capacity
+        xs[headIndex] = x
+        ys[headIndex] = y
+        self.headIndex = headIndex
 
-        # replace old snake tail with new head segment
-        self.segments[tailIndex] = newHeadPosition
-        self.headIndex = tailIndex
-        consumedSymbol = self.board.GetSymbol(newHeadPosition)
-        self.board.SetSymbol(newHeadPosition, Snake.kBodySymbol)
+        headBoardIndex = board.CoordinateToIndex(x, y)
+        consumedSymbol = board.GetSymbolAtIndex(headBoardIndex)
+        board.SetSymbolAtIndex(headBoardIndex, kSnakeBodySymbol)
 
-        return newHeadPosition, consumedSymbol
+        return headBoardIndex, consumedSymbol
 
 
 class Apple:
+    __slots__ = ("game", "index")
+
     game:"Game"
-    symbol = f"{ControlCodes.RedFG}O{ControlCodes.Reset}"
-    position:Position
+    symbol = kAppleSymbol
+
+    # grid index of the apple
+    index:int
 
     def __init__(self, game:"Game", position:Position):
         self.game = game
 
-        self.position = copy(position)
-        self.game.board.SetSymbol(position, self.symbol)
+        self.index = self.game.board.PositionToIndex(position)
+        self.game.board.SetSymbolAtIndex(self.index, self.symbol)
 
 
     def SetPosition(self, position:Position) -> None:       
-        oldPosition = self.position
-        self.game.board.SetSymbol(oldPosition, Board.kEmptySymbol)
+        self.game.board.SetSymbolAtIndex(self.index, kEmptySymbol)
 
-        self.position = copy(position)
-        self.game.board.SetSymbol(position, self.symbol)
+        self.index = self.game.board.PositionToIndex(position)
+        self.game.board.SetSymbolAtIndex(self.index, self.symbol)
 
     def Eat(self) -> None:
         self.game.score+= 1
@@ -285,7 +406,9 @@ class Apple:
         pass
 
 class SuperApple(Apple):
-    symbol = f"{ControlCodes.CyanFG}S{ControlCodes.Reset}"
+    __slots__ = ()
+
+    symbol = kSuperAppleSymbol
 
     def Eat(self):
         self.game.score+= 10
@@ -294,15 +417,25 @@ class SuperApple(Apple):
 
 
 class Game:
+    # terminal rows (1-based) of the score header and the top of the board
+    kScoreRow:Final = 1
+    kBoardRow:Final = kScoreRow + 1
 
     board:Board
     snake:Snake
 
-    apples:dict[Position, Apple] = {}
+    # direction changes pushed by the keyboard listener thread, applied one per tick by Update
+    inputQueue:deque[Direction]
+
+    # apples keyed by their grid index
+    apples:dict[int, Apple] = {}
 
     score:int = 0
     updateInterval = 1/2
 
+    # score shown on screen, or None if the screen hasn't been drawn yet
+    drawnScore:int | None = None
+
     appleClasses = [
         Apple, SuperApple
     ]
@@ -315,39 +448,52 @@ class Game:
             Position(width//2, height//2)
         )
 
+        self.inputQueue = deque(maxlen=4)
+
         self.SpawnApple()
 
     def Draw(self) -> None:
-        # clear the screen
-        displayStr = ControlCodes.ClearScreen
+        if self.drawnScore is None:
+            # first frame: clear the screen, score header and board written in a single call
+            displayStr = f"{ControlCodes.ClearScreen}Score: {self.score}\n{self.board}"
 
-        # score header
-        displayStr+= f"Score: {self.score}\n"
+        else:
+            # only redraw what changed since the last frame
+            displayParts = []
+            if self.score != self.drawnScore:
+                displayParts.append(f"{ControlCodes.MoveCursor(Game.kScoreRow, 1)}Score: {self.score}{ControlCodes.EraseLine}")
 
-        # board
-        displayStr+= str(self.board)
-    
-        print(displayStr, end="")
+            symbols = Board.symbols
+            grid = self.board.grid
+            paddedWidth = self.board.paddedWidth
+            boardRow = Game.kBoardRow
+            moveCursor = ControlCodes.MoveCursor
+            for index in self.board.dirtyIndices:
+                y, x = divmod(index, paddedWidth)
+                displayParts.append(f"{moveCursor(boardRow + y, 1 + x)}{symbols[grid[index]]}")
 
+            # park the cursor below the board so other output doesn't overwrite it
+            displayParts.append(ControlCodes.MoveCursor(Game.kBoardRow + self.board.paddedHeight, 1))
+            displayStr = "".join(displayParts)
 
-    def ProcessInput(self, key:keyboard.Key) -> None:
+        self.board.dirtyIndices.clear()
+        self.drawnScore = self.score
 
-        # Update Snake direction
-        match key:
-            case keyboard.Key.up:
-                self.snake.direction = Direction.Up
+        sys.stdout.write(displayStr)
+        sys.stdout.flush()
 
-            case keyboard.Key.down:
-                self.snake.direction = Direction.Down
 
-            case keyboard.Key.left:
-                self.snake.direction = Direction.Left
+    def ProcessInput(self, key:keyboard.Key) -> None:
 
-            case keyboard.Key.right:
-                self.snake.direction = Direction.Right
+        # Queue Snake direction change. Note: deque.append is atomic so this is safe to call from the listener thread
+        direction = kKeyDirections.get(key)
+        if direction is not None:
+            self.inputQueue.append(direction)
 
 
     def GameOver(self, message:str) -> None:
+        # force a full redraw so any earlier game over message is cleared
+        self.drawnScore = None
         self.Draw()
         print(f"! GAME OVER !\n~ {message}\n")
 
@@ -359,7 +505,8 @@ class Game:
 
         # create a random apple 
         appleClass = random.choice(self.appleClasses)
-        self.apples[applePosition] = appleClass(self, applePosition)
+        apple = appleClass(self, applePosition)
+        self.apples[apple.index] = apple
 
         return True
 
@@ -367,11 +514,23 @@ class Game:
     def Update(self) -> bool:
         """Updates the game state and returns true if the game is still running, or false if the game has ended"""
 
-        snakePosition, consumedSymbol = self.snake.Move()
+        # apply the next queued direction change, skipping any that wouldn't turn the snake or would turn it back into itself
+        while self.inputQueue:
+            direction = self.inputQueue.popleft()
+            if direction == self.snake.direction:
+                continue
+
+            if direction == self.snake.direction.Opposite() and self.snake.Size() > 1:
+                continue
+
+            self.snake.direction = direction
+            break
+
+        snakeIndex, consumedSymbol = self.snake.Move()
         
         # check if we hit an apple and eat it
-        if snakePosition in self.apples:
-            apple = self.apples.pop(snakePosition)
+        apple = self.apples.pop(snakeIndex, None)
+        if apple is not None:
             apple.Eat()
             
             # spawn a new apple
@@ -379,13 +538,14 @@ class Game:
                 self.GameOver("You Win!")
 
         # check if the snake intersects its body
-        if consumedSymbol == Snake.kBodySymbol:
+        if consumedSymbol == kSnakeBodySymbol:
             self.snake.Kill()
             self.GameOver("Ouch!")
             return False
 
-        # check if the snake's head is out of bounds
-        if not self.board.InBounds(snakePosition):
+        # check if the snake's head is out of bounds.
+        # Note: the boarder surrounds the board so running off of it always consumes a boarder symbol
+        if Board.IsBoarderSymbol(consumedSymbol):
             self.snake.Kill()
             self.GameOver("Don't Run Away!")
             return False
@@ -400,9 +560,19 @@ class Game:
         keyboardListener = keyboard.Listener(on_press=self.ProcessInput)
         keyboardListener.start()
 
+        # Note: ticks are scheduled against a deadline so the time spent drawing/updating doesn't slow the game down
+        nextTickTime = monotonic() + self.updateInterval
         while True:
             self.Draw()
-            sleep(self.updateInterval)
+
+            remainingTime = nextTickTime - monotonic()
+            if remainingTime > 0:
+                sleep(remainingTime)
+            else:
+                # we fell behind, don't try to catch up by running a burst of ticks
+                nextTickTime = monotonic()
+
+            nextTickTime+= self.updateInterval
             if not self.Update():
                 break
 